@@ -1,9 +1,9 @@
 """
 Configuration management for the LLM Decompose Tool
 """
+from functools import lru_cache
 from pydantic_settings import BaseSettings
 from typing import Optional, List
-import os
 
 
 class Settings(BaseSettings):
@@ -59,5 +59,14 @@ class Settings(BaseSettings):
         case_sensitive = True
 
 
-# Global settings instance
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the process-wide settings instance (.env is parsed only once)"""
+    return Settings()
+
+
+def __getattr__(name: str):
+    """Resolve the legacy module-level ``settings`` lazily"""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -13,22 +13,39 @@ All providers support:
 - Streaming responses
 """
 
+from typing import TYPE_CHECKING
+import importlib
+
 from .base import BaseLLMProvider
-from .openai_provider import OpenAIProvider
-from .anthropic_provider import AnthropicProvider
-from .grok_provider import GrokProvider
-from .gemini_provider import GeminiProvider
+from .session_pool import ProviderSessionPool
 from .provider_factory import (
     LLMProviderFactory,
     LLMProviderManager,
     ProviderType,
+    ProviderInfo,
+    ProviderListEntry,
     get_global_manager,
     initialize_providers_from_config
 )
 
+if TYPE_CHECKING:
+    from .openai_provider import OpenAIProvider
+    from .anthropic_provider import AnthropicProvider
+    from .grok_provider import GrokProvider
+    from .gemini_provider import GeminiProvider
+
+# Provider classes are imported on first access (PEP 562)
+_LAZY_PROVIDERS = {
+    "OpenAIProvider": ".openai_provider",
+    "AnthropicProvider": ".anthropic_provider",
+    "GrokProvider": ".grok_provider",
+    "GeminiProvider": ".gemini_provider",
+}
+
 __all__ = [
     # Base
     "BaseLLMProvider",
+    "ProviderSessionPool",
 
     # Providers
     "OpenAIProvider",
@@ -40,6 +57,17 @@ __all__ = [
     "LLMProviderFactory",
     "LLMProviderManager",
     "ProviderType",
+    "ProviderInfo",
+    "ProviderListEntry",
     "get_global_manager",
     "initialize_providers_from_config",
 ]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_PROVIDERS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
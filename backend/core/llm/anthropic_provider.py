@@ -5,7 +5,6 @@ Knowledge cutoff: January 2025 (most extensive), July 2025 (Sonnet 4.5 trained o
 Context window: Up to 1M tokens with context-1m-2025-08-07 header
 """
 from typing import AsyncIterator, List, Optional
-import json
 
 from .base import BaseLLMProvider
 from models.llm_models import (
@@ -19,11 +18,61 @@ from models.llm_models import (
 )
 
 
+def _convert_tool_message(msg: Message) -> dict:
+    """Tool result message (Anthropic expects it as a user turn)"""
+    return {
+        "role": "user",
+        "content": [
+            {
+                "type": "tool_result",
+                "tool_use_id": msg.tool_call_id,
+                "content": msg.content or ""
+            }
+        ]
+    }
+
+
+def _convert_assistant_message(msg: Message) -> dict:
+    """Assistant message, with tool_use blocks when it carries tool calls"""
+    if not msg.tool_calls:
+        return {"role": "assistant", "content": msg.content or ""}
+
+    content_blocks = [{"type": "text", "text": msg.content}] if msg.content else []
+    content_blocks.extend(
+        {
+            "type": "tool_use",
+            "id": tc.id,
+            "name": tc.name,
+            "input": tc.get_arguments_dict()
+        }
+        for tc in msg.tool_calls
+    )
+    return {"role": "assistant", "content": content_blocks}
+
+
+def _convert_user_message(msg: Message) -> dict:
+    """Regular user message"""
+    if msg.tool_calls:
+        return _convert_assistant_message(msg)
+    return {"role": "user", "content": msg.content or ""}
+
+
+# Stream events consumed by stream_complete; others are never JSON-decoded
+_STREAM_EVENTS = frozenset({b"content_block_delta", b"message_stop"})
+
+# Role -> converter dispatch; unlisted roles are sent as assistant turns
+_MESSAGE_CONVERTERS = {
+    MessageRole.USER: _convert_user_message,
+    MessageRole.ASSISTANT: _convert_assistant_message,
+    MessageRole.TOOL: _convert_tool_message,
+}
+
+
 class AnthropicProvider(BaseLLMProvider):
     """Anthropic provider for Claude models (2025)"""
 
     DEFAULT_BASE_URL = "https://api.anthropic.com/v1"
-    SUPPORTED_MODELS = [
+    SUPPORTED_MODELS_ORDERED = (
         # Claude 4.5 Series (2025) - Latest flagship models
         "claude-sonnet-4-5",        # September 2025 - Best coding model, $3/$15 per 1M tokens
         "claude-haiku-4-5",         # October 2025 - Fast and economical, $1/$5 per 1M tokens
@@ -42,7 +91,10 @@ class AnthropicProvider(BaseLLMProvider):
         "claude-3-5-sonnet-20240620",
         "claude-3-5-sonnet-20241022",
         "claude-3-5-haiku-20241022",
-    ]
+    )
+    SUPPORTED_MODELS = frozenset(SUPPORTED_MODELS_ORDERED)
+    SUPPORTS_TOOL_CALLING = True
+    SUPPORTS_STRUCTURED_OUTPUT = True  # Via tool calling with JSON schema
     API_VERSION = "2023-06-01"
 
     def __init__(self, api_key: str, base_url: Optional[str] = None, timeout: int = 120):
@@ -51,20 +103,18 @@ class AnthropicProvider(BaseLLMProvider):
             base_url=base_url or self.DEFAULT_BASE_URL,
             timeout=timeout
         )
+        self._messages_url = f"{self.base_url}/messages"
+        # Anthropic authenticates with x-api-key instead of a Bearer token
+        self._default_headers = {
+            "x-api-key": api_key,
+            "anthropic-version": self.API_VERSION,
+            "Content-Type": "application/json"
+        }
 
     @property
     def provider_name(self) -> str:
         return "anthropic"
 
-    def supports_structured_output(self) -> bool:
-        return True  # Via tool calling with JSON schema
-
-    def supports_tool_calling(self) -> bool:
-        return True
-
-    def get_supported_models(self) -> List[str]:
-        return self.SUPPORTED_MODELS
-
     def _convert_messages(self, messages: List[Message]) -> tuple[str, List[dict]]:
         """
         Convert unified messages to Anthropic format
@@ -72,51 +122,15 @@ class AnthropicProvider(BaseLLMProvider):
         """
         system_prompt = ""
         claude_messages = []
+        append = claude_messages.append
+        converters = _MESSAGE_CONVERTERS
 
         for msg in messages:
             if msg.role == MessageRole.SYSTEM:
                 # Anthropic uses separate system parameter
                 system_prompt = msg.content or ""
-            elif msg.role == MessageRole.TOOL:
-                # Tool result message
-                claude_messages.append({
-                    "role": "user",
-                    "content": [
-                        {
-                            "type": "tool_result",
-                            "tool_use_id": msg.tool_call_id,
-                            "content": msg.content or ""
-                        }
-                    ]
-                })
-            elif msg.tool_calls:
-                # Assistant message with tool calls
-                content_blocks = []
-                if msg.content:
-                    content_blocks.append({
-                        "type": "text",
-                        "text": msg.content
-                    })
-
-                for tc in msg.tool_calls:
-                    content_blocks.append({
-                        "type": "tool_use",
-                        "id": tc.id,
-                        "name": tc.name,
-                        "input": tc.get_arguments_dict()
-                    })
-
-                claude_messages.append({
-                    "role": "assistant",
-                    "content": content_blocks
-                })
             else:
-                # Regular message
-                role = "user" if msg.role == MessageRole.USER else "assistant"
-                claude_messages.append({
-                    "role": role,
-                    "content": msg.content or ""
-                })
+                append(converters.get(msg.role, _convert_assistant_message)(msg))
 
         return system_prompt, claude_messages
 
@@ -158,7 +172,7 @@ class AnthropicProvider(BaseLLMProvider):
 
         # Handle tools
         if request.tools:
-            payload["tools"] = self._convert_tools(request.tools)
+            payload["tools"] = self._convert_tools_cached(request.tools)
             if request.tool_choice:
                 if isinstance(request.tool_choice, str):
                     if request.tool_choice == "auto":
@@ -174,7 +188,7 @@ class AnthropicProvider(BaseLLMProvider):
             structured_tool = {
                 "name": request.structured_output.name,
                 "description": request.structured_output.description or "Generate structured output",
-                "input_schema": request.structured_output.schema
+                "input_schema": self._schema_payload(request.structured_output)
             }
             payload["tools"] = [structured_tool]
             payload["tool_choice"] = {"type": "tool", "name": request.structured_output.name}
@@ -186,12 +200,12 @@ class AnthropicProvider(BaseLLMProvider):
         content_blocks = response.get("content", [])
 
         # Build message
-        message_content = ""
+        text_parts = []
         tool_calls = []
 
         for block in content_blocks:
             if block["type"] == "text":
-                message_content += block["text"]
+                text_parts.append(block["text"])
             elif block["type"] == "tool_use":
                 tool_calls.append(ToolCall(
                     id=block["id"],
@@ -199,6 +213,7 @@ class AnthropicProvider(BaseLLMProvider):
                     arguments=block["input"]
                 ))
 
+        message_content = "".join(text_parts)
         message = Message(
             role=MessageRole.ASSISTANT,
             content=message_content if message_content else None,
@@ -226,70 +241,27 @@ class AnthropicProvider(BaseLLMProvider):
     async def complete(self, request: LLMRequest) -> LLMResponse:
         """Send completion request to Anthropic"""
         payload = self._convert_request(request)
-
-        # Anthropic requires special headers
-        headers = {
-            "x-api-key": self.api_key,
-            "anthropic-version": self.API_VERSION,
-            "Content-Type": "application/json"
-        }
-
-        # Override authorization header
-        response = await self._make_request("/messages", payload, headers)
+        response = await self._post_json(self._messages_url, payload)
         return self._convert_response(response, request)
 
-    async def _make_request(
-        self,
-        endpoint: str,
-        payload: dict,
-        headers: Optional[dict] = None
-    ) -> dict:
-        """Override to use x-api-key instead of Authorization header"""
-        if not self.session:
-            raise RuntimeError("Session not initialized. Use async context manager.")
-
-        default_headers = {
-            "Content-Type": "application/json",
-            "x-api-key": self.api_key,
-            "anthropic-version": self.API_VERSION
-        }
-        if headers:
-            default_headers.update(headers)
-
-        url = f"{self.base_url}{endpoint}" if self.base_url else endpoint
-
-        async with self.session.post(
-            url,
-            json=payload,
-            headers=default_headers
-        ) as response:
-            response.raise_for_status()
-            return await response.json()
-
     async def stream_complete(self, request: LLMRequest) -> AsyncIterator[LLMStreamChunk]:
         """Send streaming completion request to Anthropic"""
         request.stream = True
         payload = self._convert_request(request)
 
-        headers = {
-            "x-api-key": self.api_key,
-            "anthropic-version": self.API_VERSION,
-            "Content-Type": "application/json"
-        }
-
-        async for chunk_data in self._stream_request("/messages", payload, headers):
+        async for chunk_data in self._post_stream(self._messages_url, payload, events=_STREAM_EVENTS):
             event_type = chunk_data.get("type")
 
             if event_type == "content_block_delta":
                 delta = chunk_data.get("delta", {})
-                yield LLMStreamChunk(
-                    id=chunk_data.get("index", ""),
+                yield LLMStreamChunk.model_construct(
+                    id=str(chunk_data.get("index", "")),
                     model=request.model,
                     delta=delta,
                     finish_reason=None
                 )
             elif event_type == "message_stop":
-                yield LLMStreamChunk(
+                yield LLMStreamChunk.model_construct(
                     id="final",
                     model=request.model,
                     delta={},
@@ -2,39 +2,86 @@
 Base LLM provider interface
 """
 from abc import ABC, abstractmethod
-from typing import Optional, AsyncIterator, List
+import asyncio
+from typing import Optional, AsyncIterator, Callable, Dict, List, FrozenSet, Tuple
 import aiohttp
-import json
 
+import json_codec
+from .session_pool import ProviderSessionPool
 from models.llm_models import (
     LLMRequest,
     LLMResponse,
     LLMStreamChunk,
     Message,
+    StructuredOutputSchema,
     ToolDefinition
 )
 
 
+async def _iter_lines(content: aiohttp.StreamReader) -> AsyncIterator[bytes]:
+    """
+    Split a response body into lines without the trailing newline
+
+    Reads whatever bytes the socket has ready via iter_any() and splits
+    them out of one reusable buffer, instead of awaiting once per line.
+    """
+    buffer = bytearray()
+    async for chunk in content.iter_any():
+        buffer += chunk
+        start = 0
+        while (end := buffer.find(b'\n', start)) >= 0:
+            yield bytes(buffer[start:end])
+            start = end + 1
+        del buffer[:start]
+    if buffer:
+        yield bytes(buffer)
+
+
 class BaseLLMProvider(ABC):
     """Base class for all LLM providers"""
 
+    # Display order lives in the tuple; the frozenset serves membership checks
+    SUPPORTED_MODELS_ORDERED: Tuple[str, ...] = ()
+    SUPPORTED_MODELS: FrozenSet[str] = frozenset()
+
+    # Static capabilities; readable on the class without an instance
+    SUPPORTS_TOOL_CALLING: bool = False
+    SUPPORTS_STRUCTURED_OUTPUT: bool = False
+
+    # Distinct tool lists whose converted form is kept per provider instance
+    TOOLS_CACHE_SIZE = 32
+
+    # Converted messages kept per provider instance
+    HISTORY_CACHE_SIZE = 512
+
+    # Default cap on in-flight requests issued by complete_batched()
+    BATCH_CONCURRENCY = 8
+
     def __init__(self, api_key: str, base_url: Optional[str] = None, timeout: int = 120):
         self.api_key = api_key
         self.base_url = base_url
         self.timeout = timeout
+        self._client_timeout = aiohttp.ClientTimeout(total=timeout)
+        # Built once; per-call headers are merged on top only when given
+        self._default_headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {api_key}"
+        }
         self.session: Optional[aiohttp.ClientSession] = None
+        # Tool identity key -> (tools, converted); holding the tools pins the ids
+        self._tools_cache: Dict[tuple, Tuple[tuple, List[dict]]] = {}
+        # id(message) -> (message, content, tool_calls, converted); holding the
+        # message pins the id
+        self._history_cache: Dict[int, Tuple[Message, Optional[str], Optional[list], dict]] = {}
 
     async def __aenter__(self):
-        """Async context manager entry"""
-        self.session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=self.timeout)
-        )
+        """Async context manager entry (borrows the shared pooled session)"""
+        self.session = ProviderSessionPool.get_session()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit"""
-        if self.session:
-            await self.session.close()
+        """Async context manager exit (connections stay pooled for reuse)"""
+        pass
 
     @property
     @abstractmethod
@@ -52,6 +99,88 @@ class BaseLLMProvider(ABC):
         """Convert provider-specific response to unified format"""
         pass
 
+    @abstractmethod
+    def _convert_tools(self, tools: List[ToolDefinition]) -> List[dict]:
+        """Convert unified tools to provider-specific format"""
+        pass
+
+    def _convert_tools_cached(self, tools: List[ToolDefinition]) -> List[dict]:
+        """
+        Convert tools, reusing the result for a previously seen tool list
+
+        Agent loops send the same ToolDefinition objects on every turn, so
+        the converted list is cached by tool identity. Reassigning a tool's
+        name, description or parameters misses the cache; call
+        invalidate_tools_cache() after mutating parameters in place.
+        """
+        key = tuple(
+            (id(tool), tool.name, tool.description, id(tool.parameters))
+            for tool in tools
+        )
+        cached = self._tools_cache.get(key)
+        if cached is not None:
+            return cached[1]
+
+        converted = self._convert_tools(tools)
+        if len(self._tools_cache) >= self.TOOLS_CACHE_SIZE:
+            # Evict the oldest entry (dicts keep insertion order)
+            del self._tools_cache[next(iter(self._tools_cache))]
+        self._tools_cache[key] = (tuple(tools), converted)
+        return converted
+
+    def invalidate_tools_cache(self):
+        """Drop cached tool conversions"""
+        self._tools_cache.clear()
+
+    def _convert_messages_cached(
+        self,
+        messages: List[Message],
+        convert: Callable[[Message], dict]
+    ) -> List[dict]:
+        """
+        Convert messages one-to-one, reusing earlier conversions per message
+
+        Agent loops resend the same Message objects every turn, and
+        conversations often share one system-prompt Message, so each message
+        is cached by identity on its own. Reassigning content or tool_calls
+        misses the cache; call invalidate_history_cache() after mutating
+        them in place.
+        """
+        cache = self._history_cache
+        converted: List[dict] = []
+        for msg in messages:
+            key = id(msg)
+            cached = cache.get(key)
+            if (
+                cached is None
+                or cached[1] is not msg.content
+                or cached[2] is not msg.tool_calls
+            ):
+                cached = (msg, msg.content, msg.tool_calls, convert(msg))
+                if key not in cache and len(cache) >= self.HISTORY_CACHE_SIZE:
+                    # Evict the oldest entry (dicts keep insertion order)
+                    del cache[next(iter(cache))]
+                cache[key] = cached
+            # Callers may edit the top-level dict; nested values are shared
+            converted.append(dict(cached[3]))
+        return converted
+
+    def invalidate_history_cache(self):
+        """Drop cached message conversions"""
+        self._history_cache.clear()
+
+    @staticmethod
+    def _schema_payload(structured_output: StructuredOutputSchema):
+        """
+        Structured-output schema to embed in a payload
+
+        When the codec can embed raw JSON, the schema's cached encoding is
+        used so large schemas are not re-serialized on every request.
+        """
+        if json_codec.Fragment is None:
+            return structured_output.schema
+        return json_codec.Fragment(structured_output.get_schema_json())
+
     @abstractmethod
     async def complete(self, request: LLMRequest) -> LLMResponse:
         """
@@ -78,6 +207,37 @@ class BaseLLMProvider(ABC):
         """
         pass
 
+    async def complete_batched(
+        self,
+        requests: List[LLMRequest],
+        max_concurrency: Optional[int] = None
+    ) -> List[LLMResponse]:
+        """
+        Send several completion requests concurrently
+
+        Requests are pipelined over the pooled keep-alive connections
+        rather than merged into one prompt, so each keeps its own
+        messages and response.
+
+        Args:
+            requests: Unified LLM requests
+            max_concurrency: Cap on in-flight requests (default BATCH_CONCURRENCY)
+
+        Returns:
+            Responses in the same order as requests
+        """
+        semaphore = asyncio.Semaphore(max_concurrency or self.BATCH_CONCURRENCY)
+
+        async def run(request: LLMRequest) -> LLMResponse:
+            async with semaphore:
+                return await self.complete(request)
+
+        return list(await asyncio.gather(*(run(request) for request in requests)))
+
+    def _endpoint_url(self, endpoint: str) -> str:
+        """Resolve an endpoint against base_url"""
+        return f"{self.base_url}{endpoint}" if self.base_url else endpoint
+
     async def _make_request(
         self,
         endpoint: str,
@@ -95,31 +255,14 @@ class BaseLLMProvider(ABC):
         Returns:
             Response JSON
         """
-        if not self.session:
-            raise RuntimeError("Session not initialized. Use async context manager.")
-
-        default_headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {self.api_key}"
-        }
-        if headers:
-            default_headers.update(headers)
-
-        url = f"{self.base_url}{endpoint}" if self.base_url else endpoint
-
-        async with self.session.post(
-            url,
-            json=payload,
-            headers=default_headers
-        ) as response:
-            response.raise_for_status()
-            return await response.json()
+        return await self._post_json(self._endpoint_url(endpoint), payload, headers)
 
     async def _stream_request(
         self,
         endpoint: str,
         payload: dict,
-        headers: Optional[dict] = None
+        headers: Optional[dict] = None,
+        events: Optional[FrozenSet[bytes]] = None
     ) -> AsyncIterator[dict]:
         """
         Make streaming HTTP request to provider API
@@ -128,48 +271,117 @@ class BaseLLMProvider(ABC):
             endpoint: API endpoint
             payload: Request payload
             headers: Additional headers
+            events: SSE event names to decode (see _post_stream)
 
         Yields:
             Response chunks as JSON
         """
+        async for chunk in self._post_stream(self._endpoint_url(endpoint), payload, headers, events):
+            yield chunk
+
+    def _post(self, url: str, payload: dict, headers: Optional[dict] = None):
+        """
+        Start a JSON POST on the shared session
+
+        Args:
+            url: Absolute request URL
+            payload: Request payload
+            headers: Additional headers
+
+        Returns:
+            The aiohttp request context manager
+        """
         if not self.session:
             raise RuntimeError("Session not initialized. Use async context manager.")
 
-        default_headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {self.api_key}"
-        }
-        if headers:
-            default_headers.update(headers)
-
-        url = f"{self.base_url}{endpoint}" if self.base_url else endpoint
+        request_headers = {**self._default_headers, **headers} if headers else self._default_headers
 
-        async with self.session.post(
+        # Encode straight to bytes; the default headers carry the JSON Content-Type
+        return self.session.post(
             url,
-            json=payload,
-            headers=default_headers
-        ) as response:
+            data=json_codec.dumps_bytes(payload),
+            headers=request_headers,
+            timeout=self._client_timeout
+        )
+
+    async def _post_json(
+        self,
+        url: str,
+        payload: dict,
+        headers: Optional[dict] = None
+    ) -> dict:
+        """
+        POST to a fully resolved URL and return the JSON response
+
+        Providers precompute their URLs so the per-call path does no
+        string formatting.
+
+        Args:
+            url: Absolute request URL
+            payload: Request payload
+            headers: Additional headers
+
+        Returns:
+            Response JSON
+        """
+        async with self._post(url, payload, headers) as response:
+            response.raise_for_status()
+            return json_codec.loads(await response.read())
+
+    async def _post_stream(
+        self,
+        url: str,
+        payload: dict,
+        headers: Optional[dict] = None,
+        events: Optional[FrozenSet[bytes]] = None
+    ) -> AsyncIterator[dict]:
+        """
+        POST to a fully resolved URL and yield Server-Sent Events as JSON
+
+        Args:
+            url: Absolute request URL
+            payload: Request payload
+            headers: Additional headers
+            events: SSE event names to decode; frames of other named events
+                are skipped without being parsed (None decodes everything)
+
+        Yields:
+            Response chunks as JSON
+        """
+        async with self._post(url, payload, headers) as response:
             response.raise_for_status()
 
-            async for line in response.content:
-                line_str = line.decode('utf-8').strip()
-                if line_str.startswith('data: '):
-                    data_str = line_str[6:]
-                    if data_str == '[DONE]':
+            # Work on raw bytes: the codec decodes UTF-8 itself, so lines never
+            # need to be materialized as str
+            event = None
+            async for line in _iter_lines(response.content):
+                if line.startswith(b'event: '):
+                    event = line[7:].rstrip()
+                elif line.startswith(b'data: '):
+                    skip = events is not None and event not in events
+                    event = None
+                    if skip:
+                        continue
+                    data = line[6:].rstrip()
+                    if data == b'[DONE]':
                         break
                     try:
-                        yield json.loads(data_str)
-                    except json.JSONDecodeError:
+                        yield json_codec.loads(data)
+                    except json_codec.JSONDecodeError:
                         continue
 
     def supports_structured_output(self) -> bool:
-        """Check if provider supports structured output"""
-        return False
+        """Check if provider supports structured output (see SUPPORTS_STRUCTURED_OUTPUT)"""
+        return self.SUPPORTS_STRUCTURED_OUTPUT
 
     def supports_tool_calling(self) -> bool:
-        """Check if provider supports tool calling"""
-        return False
+        """Check if provider supports tool calling (see SUPPORTS_TOOL_CALLING)"""
+        return self.SUPPORTS_TOOL_CALLING
+
+    def get_supported_models(self) -> Tuple[str, ...]:
+        """Get supported models in display order"""
+        return self.SUPPORTED_MODELS_ORDERED
 
-    def get_supported_models(self) -> List[str]:
-        """Get list of supported models"""
-        return []
+    def supports_model(self, model: str) -> bool:
+        """Check if a model is supported by this provider"""
+        return model in self.SUPPORTED_MODELS
@@ -5,8 +5,7 @@ Knowledge cutoff: Varies by model
 Context window: Varies (Pro has longer context)
 Note: Gemini 1.x models are fully retired as of April 2025
 """
-from typing import AsyncIterator, List, Optional
-import json
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 
 from .base import BaseLLMProvider
 from models.llm_models import (
@@ -20,11 +19,65 @@ from models.llm_models import (
 )
 
 
+def _convert_tool_message(msg: Message) -> dict:
+    """Tool response, sent as a functionResponse part"""
+    return {
+        "role": "function",
+        "parts": [{
+            "functionResponse": {
+                "name": msg.name or "unknown",
+                "response": {
+                    "content": msg.content or ""
+                }
+            }
+        }]
+    }
+
+
+def _convert_model_message(msg: Message) -> dict:
+    """Model turn, with functionCall parts when it carries tool calls"""
+    if not msg.tool_calls:
+        return {"role": "model", "parts": [{"text": msg.content or ""}]}
+
+    parts = [{"text": msg.content}] if msg.content else []
+    parts.extend(
+        {
+            "functionCall": {
+                "name": tc.name,
+                "args": tc.get_arguments_dict()
+            }
+        }
+        for tc in msg.tool_calls
+    )
+    return {"role": "model", "parts": parts}
+
+
+def _convert_user_message(msg: Message) -> dict:
+    """Regular user message"""
+    if msg.tool_calls:
+        return _convert_model_message(msg)
+    return {"role": "user", "parts": [{"text": msg.content or ""}]}
+
+
+# Unified tool_choice -> Gemini functionCallingConfig mode
+_FUNCTION_CALLING_MODES = {
+    "required": "ANY",
+    "auto": "AUTO",
+    "none": "NONE",
+}
+
+# Role -> converter dispatch; unlisted roles are sent as model turns
+_MESSAGE_CONVERTERS = {
+    MessageRole.USER: _convert_user_message,
+    MessageRole.TOOL: _convert_tool_message,
+}
+
+
 class GeminiProvider(BaseLLMProvider):
     """Google Gemini provider (2025)"""
 
     DEFAULT_BASE_URL = "https://generativelanguage.googleapis.com/v1beta"
-    SUPPORTED_MODELS = [
+    SUPPORTED_MODELS_ORDERED = (
         # Gemini 2.5 Series (2025)
         "gemini-2.5-pro",                    # Most powerful model with adaptive thinking
         "gemini-2.5-flash",                  # Fast and efficient, #2 on LMarena leaderboard
@@ -37,7 +90,17 @@ class GeminiProvider(BaseLLMProvider):
         # Note: Gemini 1.x models retired April 29, 2025
         # Use gemini-2.5-flash-lite for lightweight tasks
         "gemini-2.5-flash-lite",
-    ]
+    )
+    SUPPORTED_MODELS = frozenset(SUPPORTED_MODELS_ORDERED)
+    SUPPORTS_TOOL_CALLING = True
+    SUPPORTS_STRUCTURED_OUTPUT = True
+
+    # Streaming asks for SSE framing; the default is one pretty-printed JSON
+    # array whose elements span many lines
+    _METHOD_QUERIES = {
+        "generateContent": "?",
+        "streamGenerateContent": "?alt=sse&",
+    }
 
     def __init__(self, api_key: str, base_url: Optional[str] = None, timeout: int = 120):
         super().__init__(
@@ -45,20 +108,15 @@ class GeminiProvider(BaseLLMProvider):
             base_url=base_url or self.DEFAULT_BASE_URL,
             timeout=timeout
         )
+        # Gemini authenticates via the key query parameter, not a Bearer token
+        self._default_headers = {"Content-Type": "application/json"}
+        # (supported model, method) -> request URL; the key rides in the query string
+        self._model_urls: Dict[Tuple[str, str], str] = {}
 
     @property
     def provider_name(self) -> str:
         return "gemini"
 
-    def supports_structured_output(self) -> bool:
-        return True
-
-    def supports_tool_calling(self) -> bool:
-        return True
-
-    def get_supported_models(self) -> List[str]:
-        return self.SUPPORTED_MODELS
-
     def _convert_messages(self, messages: List[Message]) -> tuple[Optional[str], List[dict]]:
         """
         Convert unified messages to Gemini format
@@ -66,49 +124,15 @@ class GeminiProvider(BaseLLMProvider):
         """
         system_instruction = None
         gemini_contents = []
+        append = gemini_contents.append
+        converters = _MESSAGE_CONVERTERS
 
         for msg in messages:
             if msg.role == MessageRole.SYSTEM:
                 # Gemini uses separate system_instruction
                 system_instruction = msg.content
-            elif msg.role == MessageRole.TOOL:
-                # Tool response
-                gemini_contents.append({
-                    "role": "function",
-                    "parts": [{
-                        "functionResponse": {
-                            "name": msg.name or "unknown",
-                            "response": {
-                                "content": msg.content or ""
-                            }
-                        }
-                    }]
-                })
-            elif msg.tool_calls:
-                # Assistant message with tool calls
-                parts = []
-                if msg.content:
-                    parts.append({"text": msg.content})
-
-                for tc in msg.tool_calls:
-                    parts.append({
-                        "functionCall": {
-                            "name": tc.name,
-                            "args": tc.get_arguments_dict()
-                        }
-                    })
-
-                gemini_contents.append({
-                    "role": "model",
-                    "parts": parts
-                })
             else:
-                # Regular message
-                role = "user" if msg.role == MessageRole.USER else "model"
-                gemini_contents.append({
-                    "role": role,
-                    "parts": [{"text": msg.content or ""}]
-                })
+                append(converters.get(msg.role, _convert_model_message)(msg))
 
         return system_instruction, gemini_contents
 
@@ -133,21 +157,27 @@ class GeminiProvider(BaseLLMProvider):
         """Convert unified request to Gemini format"""
         system_instruction, contents = self._convert_messages(request.messages)
 
-        payload = {
-            "contents": contents,
-            "generationConfig": {
-                "temperature": request.temperature,
-            }
-        }
+        # generationConfig always goes out because it always carries
+        # temperature (the unified default, 0.7, differs from Gemini's server
+        # default); system_instruction, tools and toolConfig are added only
+        # when set.
+        generation_config = {"temperature": request.temperature}
 
         if request.max_tokens:
-            payload["generationConfig"]["maxOutputTokens"] = request.max_tokens
+            generation_config["maxOutputTokens"] = request.max_tokens
 
         if request.top_p:
-            payload["generationConfig"]["topP"] = request.top_p
+            generation_config["topP"] = request.top_p
 
         if request.stop:
-            payload["generationConfig"]["stopSequences"] = request.stop
+            generation_config["stopSequences"] = request.stop
+
+        # Handle structured output via response schema
+        if request.structured_output:
+            generation_config["responseMimeType"] = "application/json"
+            generation_config["responseSchema"] = self._schema_payload(request.structured_output)
+
+        payload = {"contents": contents, "generationConfig": generation_config}
 
         if system_instruction:
             payload["system_instruction"] = {
@@ -156,27 +186,13 @@ class GeminiProvider(BaseLLMProvider):
 
         # Handle tools
         if request.tools:
-            payload["tools"] = self._convert_tools(request.tools)
-
-            # Tool choice configuration
-            if request.tool_choice:
-                if request.tool_choice == "required":
-                    payload["toolConfig"] = {
-                        "functionCallingConfig": {"mode": "ANY"}
-                    }
-                elif request.tool_choice == "auto":
-                    payload["toolConfig"] = {
-                        "functionCallingConfig": {"mode": "AUTO"}
-                    }
-                elif request.tool_choice == "none":
-                    payload["toolConfig"] = {
-                        "functionCallingConfig": {"mode": "NONE"}
-                    }
+            payload["tools"] = self._convert_tools_cached(request.tools)
 
-        # Handle structured output via response schema
-        if request.structured_output:
-            payload["generationConfig"]["responseMimeType"] = "application/json"
-            payload["generationConfig"]["responseSchema"] = request.structured_output.schema
+            # Tool choice configuration (specific-tool dicts have no Gemini mode)
+            if isinstance(request.tool_choice, str):
+                mode = _FUNCTION_CALLING_MODES.get(request.tool_choice)
+                if mode:
+                    payload["toolConfig"] = {"functionCallingConfig": {"mode": mode}}
 
         return payload
 
@@ -186,12 +202,12 @@ class GeminiProvider(BaseLLMProvider):
         content_parts = candidate["content"]["parts"]
 
         # Build message
-        message_content = ""
+        text_parts = []
         tool_calls = []
 
         for i, part in enumerate(content_parts):
             if "text" in part:
-                message_content += part["text"]
+                text_parts.append(part["text"])
             elif "functionCall" in part:
                 func_call = part["functionCall"]
                 tool_calls.append(ToolCall(
@@ -200,6 +216,7 @@ class GeminiProvider(BaseLLMProvider):
                     arguments=func_call.get("args", {})
                 ))
 
+        message_content = "".join(text_parts)
         message = Message(
             role=MessageRole.ASSISTANT,
             content=message_content if message_content else None,
@@ -225,17 +242,30 @@ class GeminiProvider(BaseLLMProvider):
             raw_response=response
         )
 
+    def _model_url(self, model: str, method: str) -> str:
+        """
+        Request URL for a model method
+
+        Built once per (model, method) for SUPPORTED_MODELS only, which keeps
+        the cache bounded; other caller-supplied models are formatted per call.
+        """
+        key = (model, method)
+        url = self._model_urls.get(key)
+        if url is None:
+            query = self._METHOD_QUERIES.get(method, "?")
+            url = f"{self.base_url}/models/{model}:{method}{query}key={self.api_key}"
+            if model in self.SUPPORTED_MODELS:
+                self._model_urls[key] = url
+        return url
+
     async def complete(self, request: LLMRequest) -> LLMResponse:
         """Send completion request to Gemini"""
         payload = self._convert_request(request)
 
         # Gemini uses API key as query parameter
-        endpoint = f"/models/{request.model}:generateContent?key={self.api_key}"
+        url = self._model_url(request.model, "generateContent")
 
-        # Override headers for Gemini
-        headers = {"Content-Type": "application/json"}
-
-        response = await self._make_gemini_request(endpoint, payload, headers)
+        response = await self._post_json(url, payload)
         return self._convert_response(response, request)
 
     async def stream_complete(self, request: LLMRequest) -> AsyncIterator[LLMStreamChunk]:
@@ -243,11 +273,9 @@ class GeminiProvider(BaseLLMProvider):
         payload = self._convert_request(request)
 
         # Gemini uses API key as query parameter
-        endpoint = f"/models/{request.model}:streamGenerateContent?key={self.api_key}"
-
-        headers = {"Content-Type": "application/json"}
+        url = self._model_url(request.model, "streamGenerateContent")
 
-        async for chunk_data in self._stream_gemini_request(endpoint, payload, headers):
+        async for chunk_data in self._post_stream(url, payload):
             if "candidates" in chunk_data and len(chunk_data["candidates"]) > 0:
                 candidate = chunk_data["candidates"][0]
                 delta = {}
@@ -257,56 +285,9 @@ class GeminiProvider(BaseLLMProvider):
                     if parts and "text" in parts[0]:
                         delta["content"] = parts[0]["text"]
 
-                yield LLMStreamChunk(
+                yield LLMStreamChunk.model_construct(
                     id=chunk_data.get("id", "gemini-stream"),
                     model=request.model,
                     delta=delta,
                     finish_reason=candidate.get("finishReason")
                 )
-
-    async def _make_gemini_request(
-        self,
-        endpoint: str,
-        payload: dict,
-        headers: Optional[dict] = None
-    ) -> dict:
-        """Make HTTP request to Gemini API"""
-        if not self.session:
-            raise RuntimeError("Session not initialized. Use async context manager.")
-
-        url = f"{self.base_url}{endpoint}"
-
-        async with self.session.post(
-            url,
-            json=payload,
-            headers=headers or {}
-        ) as response:
-            response.raise_for_status()
-            return await response.json()
-
-    async def _stream_gemini_request(
-        self,
-        endpoint: str,
-        payload: dict,
-        headers: Optional[dict] = None
-    ) -> AsyncIterator[dict]:
-        """Make streaming HTTP request to Gemini API"""
-        if not self.session:
-            raise RuntimeError("Session not initialized. Use async context manager.")
-
-        url = f"{self.base_url}{endpoint}"
-
-        async with self.session.post(
-            url,
-            json=payload,
-            headers=headers or {}
-        ) as response:
-            response.raise_for_status()
-
-            async for line in response.content:
-                line_str = line.decode('utf-8').strip()
-                if line_str:
-                    try:
-                        yield json.loads(line_str)
-                    except json.JSONDecodeError:
-                        continue
@@ -6,7 +6,6 @@ Context window: 256K tokens (Grok 4)
 Based on OpenAI-compatible API
 """
 from typing import AsyncIterator, List, Optional
-import json
 
 from .base import BaseLLMProvider
 from models.llm_models import (
@@ -20,11 +19,61 @@ from models.llm_models import (
 )
 
 
+# Wire role names, precomputed so conversion skips the enum .value lookup
+_ROLE_STR = {role: role.value for role in MessageRole}
+
+
+def _convert_tool_message(msg: Message) -> dict:
+    """Tool result message"""
+    return {
+        "role": "tool",
+        "content": msg.content or "",
+        "tool_call_id": msg.tool_call_id
+    }
+
+
+def _convert_tool_call_message(msg: Message) -> dict:
+    """Assistant message with tool calls"""
+    converted = {"role": "assistant"}
+    if msg.content:
+        converted["content"] = msg.content
+    converted["tool_calls"] = [
+        {
+            "id": tc.id,
+            "type": "function",
+            "function": {
+                "name": tc.name,
+                "arguments": tc.get_arguments_json()
+            }
+        }
+        for tc in msg.tool_calls
+    ]
+    return converted
+
+
+def _convert_plain_message(msg: Message) -> dict:
+    """Regular message (any role other than tool)"""
+    if msg.tool_calls:
+        return _convert_tool_call_message(msg)
+    return {"role": _ROLE_STR[msg.role], "content": msg.content or ""}
+
+
+# Role -> converter dispatch; unlisted roles go through _convert_plain_message
+_MESSAGE_CONVERTERS = {
+    MessageRole.TOOL: _convert_tool_message,
+}
+
+
+def _convert_message(msg: Message) -> dict:
+    """Convert one message through the role dispatch table"""
+    return _MESSAGE_CONVERTERS.get(msg.role, _convert_plain_message)(msg)
+
+
 class GrokProvider(BaseLLMProvider):
     """Grok provider for X.AI models (2025)"""
 
     DEFAULT_BASE_URL = "https://api.x.ai/v1"
-    SUPPORTED_MODELS = [
+    SUPPORTED_MODELS_ORDERED = (
         # Grok 4 (2025) - Most intelligent model, 256K context
         "grok-4",
         "grok-4-0709",
@@ -41,7 +90,10 @@ class GrokProvider(BaseLLMProvider):
         "grok-2",
         "grok-1",
         "grok-beta",
-    ]
+    )
+    SUPPORTED_MODELS = frozenset(SUPPORTED_MODELS_ORDERED)
+    SUPPORTS_TOOL_CALLING = True
+    SUPPORTS_STRUCTURED_OUTPUT = True
 
     def __init__(self, api_key: str, base_url: Optional[str] = None, timeout: int = 120):
         super().__init__(
@@ -49,57 +101,15 @@ class GrokProvider(BaseLLMProvider):
             base_url=base_url or self.DEFAULT_BASE_URL,
             timeout=timeout
         )
+        self._chat_completions_url = f"{self.base_url}/chat/completions"
 
     @property
     def provider_name(self) -> str:
         return "grok"
 
-    def supports_structured_output(self) -> bool:
-        return True
-
-    def supports_tool_calling(self) -> bool:
-        return True
-
-    def get_supported_models(self) -> List[str]:
-        return self.SUPPORTED_MODELS
-
     def _convert_messages(self, messages: List[Message]) -> List[dict]:
         """Convert unified messages to Grok (OpenAI-like) format"""
-        grok_messages = []
-
-        for msg in messages:
-            grok_msg = {"role": msg.role.value}
-
-            # Handle different message types
-            if msg.role == MessageRole.TOOL:
-                # Tool result message
-                grok_msg["role"] = "tool"
-                grok_msg["content"] = msg.content or ""
-                grok_msg["tool_call_id"] = msg.tool_call_id
-            elif msg.tool_calls:
-                # Assistant message with tool calls
-                grok_msg["role"] = "assistant"
-                if msg.content:
-                    grok_msg["content"] = msg.content
-                grok_msg["tool_calls"] = [
-                    {
-                        "id": tc.id,
-                        "type": "function",
-                        "function": {
-                            "name": tc.name,
-                            "arguments": tc.arguments if isinstance(tc.arguments, str)
-                            else json.dumps(tc.arguments)
-                        }
-                    }
-                    for tc in msg.tool_calls
-                ]
-            else:
-                # Regular message
-                grok_msg["content"] = msg.content or ""
-
-            grok_messages.append(grok_msg)
-
-        return grok_messages
+        return self._convert_messages_cached(messages, _convert_message)
 
     def _convert_tools(self, tools: List) -> List[dict]:
         """Convert unified tools to Grok format"""
@@ -139,7 +149,7 @@ class GrokProvider(BaseLLMProvider):
 
         # Handle tools
         if request.tools:
-            payload["tools"] = self._convert_tools(request.tools)
+            payload["tools"] = self._convert_tools_cached(request.tools)
             if request.tool_choice:
                 if isinstance(request.tool_choice, str):
                     payload["tool_choice"] = request.tool_choice
@@ -154,7 +164,7 @@ class GrokProvider(BaseLLMProvider):
                 "json_schema": {
                     "name": request.structured_output.name,
                     "description": request.structured_output.description,
-                    "schema": request.structured_output.schema,
+                    "schema": self._schema_payload(request.structured_output),
                     "strict": request.structured_output.strict
                 }
             }
@@ -204,7 +214,7 @@ class GrokProvider(BaseLLMProvider):
     async def complete(self, request: LLMRequest) -> LLMResponse:
         """Send completion request to Grok"""
         payload = self._convert_request(request)
-        response = await self._make_request("/chat/completions", payload)
+        response = await self._post_json(self._chat_completions_url, payload)
         return self._convert_response(response, request)
 
     async def stream_complete(self, request: LLMRequest) -> AsyncIterator[LLMStreamChunk]:
@@ -212,10 +222,10 @@ class GrokProvider(BaseLLMProvider):
         request.stream = True
         payload = self._convert_request(request)
 
-        async for chunk_data in self._stream_request("/chat/completions", payload):
+        async for chunk_data in self._post_stream(self._chat_completions_url, payload):
             if "choices" in chunk_data and len(chunk_data["choices"]) > 0:
                 choice = chunk_data["choices"][0]
-                yield LLMStreamChunk(
+                yield LLMStreamChunk.model_construct(
                     id=chunk_data["id"],
                     model=chunk_data["model"],
                     delta=choice.get("delta", {}),
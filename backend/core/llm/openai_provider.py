@@ -4,7 +4,7 @@ Supports: GPT-5, GPT-4.1 series, O-series reasoning models
 Knowledge cutoff: June 2024 (GPT-4.1), varies by model
 """
 from typing import AsyncIterator, List, Optional
-import json
+from functools import lru_cache
 
 from .base import BaseLLMProvider
 from models.llm_models import (
@@ -18,11 +18,69 @@ from models.llm_models import (
 )
 
 
+# Wire role names, precomputed so conversion skips the enum .value lookup
+_ROLE_STR = {role: role.value for role in MessageRole}
+
+
+def _convert_tool_message(msg: Message) -> dict:
+    """Tool result message"""
+    return {
+        "role": "tool",
+        "content": msg.content or "",
+        "tool_call_id": msg.tool_call_id
+    }
+
+
+def _convert_tool_call_message(msg: Message) -> dict:
+    """Assistant message with tool calls"""
+    converted = {"role": "assistant"}
+    if msg.content:
+        converted["content"] = msg.content
+    converted["tool_calls"] = [
+        {
+            "id": tc.id,
+            "type": "function",
+            "function": {
+                "name": tc.name,
+                "arguments": tc.get_arguments_json()
+            }
+        }
+        for tc in msg.tool_calls
+    ]
+    return converted
+
+
+def _convert_plain_message(msg: Message) -> dict:
+    """Regular message (any role other than tool)"""
+    if msg.tool_calls:
+        return _convert_tool_call_message(msg)
+    return {"role": _ROLE_STR[msg.role], "content": msg.content or ""}
+
+
+# Role -> converter dispatch; unlisted roles go through _convert_plain_message
+_MESSAGE_CONVERTERS = {
+    MessageRole.TOOL: _convert_tool_message,
+}
+
+
+def _convert_message(msg: Message) -> dict:
+    """Convert one message through the role dispatch table"""
+    return _MESSAGE_CONVERTERS.get(msg.role, _convert_plain_message)(msg)
+
+
+@lru_cache(maxsize=128)
+def _supports_json_schema(model: str) -> bool:
+    """Whether a model accepts response_format json_schema (cached per model)"""
+    # All modern models (GPT-5, GPT-4.1, O-series, GPT-4) support json_schema
+    model_lower = model.lower()
+    return any(x in model_lower for x in ("gpt-5", "gpt-4", "o3", "o4"))
+
+
 class OpenAIProvider(BaseLLMProvider):
     """OpenAI provider for GPT models (2025)"""
 
     DEFAULT_BASE_URL = "https://api.openai.com/v1"
-    SUPPORTED_MODELS = [
+    SUPPORTED_MODELS_ORDERED = (
         # GPT-5 (August 2025) - Most advanced model
         "gpt-5",
 
@@ -44,7 +102,10 @@ class OpenAIProvider(BaseLLMProvider):
         "gpt-4-turbo",
         "gpt-4",
         "gpt-3.5-turbo",
-    ]
+    )
+    SUPPORTED_MODELS = frozenset(SUPPORTED_MODELS_ORDERED)
+    SUPPORTS_TOOL_CALLING = True
+    SUPPORTS_STRUCTURED_OUTPUT = True
 
     def __init__(self, api_key: str, base_url: Optional[str] = None, timeout: int = 120):
         super().__init__(
@@ -52,57 +113,15 @@ class OpenAIProvider(BaseLLMProvider):
             base_url=base_url or self.DEFAULT_BASE_URL,
             timeout=timeout
         )
+        self._chat_completions_url = f"{self.base_url}/chat/completions"
 
     @property
     def provider_name(self) -> str:
         return "openai"
 
-    def supports_structured_output(self) -> bool:
-        return True
-
-    def supports_tool_calling(self) -> bool:
-        return True
-
-    def get_supported_models(self) -> List[str]:
-        return self.SUPPORTED_MODELS
-
     def _convert_messages(self, messages: List[Message]) -> List[dict]:
         """Convert unified messages to OpenAI format"""
-        openai_messages = []
-
-        for msg in messages:
-            openai_msg = {"role": msg.role.value}
-
-            # Handle different message types
-            if msg.role == MessageRole.TOOL:
-                # Tool result message
-                openai_msg["role"] = "tool"
-                openai_msg["content"] = msg.content or ""
-                openai_msg["tool_call_id"] = msg.tool_call_id
-            elif msg.tool_calls:
-                # Assistant message with tool calls
-                openai_msg["role"] = "assistant"
-                if msg.content:
-                    openai_msg["content"] = msg.content
-                openai_msg["tool_calls"] = [
-                    {
-                        "id": tc.id,
-                        "type": "function",
-                        "function": {
-                            "name": tc.name,
-                            "arguments": tc.arguments if isinstance(tc.arguments, str)
-                            else json.dumps(tc.arguments)
-                        }
-                    }
-                    for tc in msg.tool_calls
-                ]
-            else:
-                # Regular message
-                openai_msg["content"] = msg.content or ""
-
-            openai_messages.append(openai_msg)
-
-        return openai_messages
+        return self._convert_messages_cached(messages, _convert_message)
 
     def _convert_tools(self, tools: List) -> List[dict]:
         """Convert unified tools to OpenAI format"""
@@ -142,7 +161,7 @@ class OpenAIProvider(BaseLLMProvider):
 
         # Handle tools
         if request.tools:
-            payload["tools"] = self._convert_tools(request.tools)
+            payload["tools"] = self._convert_tools_cached(request.tools)
             if request.tool_choice:
                 if isinstance(request.tool_choice, str):
                     payload["tool_choice"] = request.tool_choice
@@ -151,15 +170,13 @@ class OpenAIProvider(BaseLLMProvider):
 
         # Handle structured output (using response_format for JSON mode)
         if request.structured_output:
-            # All modern models (GPT-5, GPT-4.1, O-series, GPT-4) support json_schema
-            model_lower = request.model.lower()
-            if any(x in model_lower for x in ["gpt-5", "gpt-4", "o3", "o4"]):
+            if _supports_json_schema(request.model):
                 payload["response_format"] = {
                     "type": "json_schema",
                     "json_schema": {
                         "name": request.structured_output.name,
                         "description": request.structured_output.description,
-                        "schema": request.structured_output.schema,
+                        "schema": self._schema_payload(request.structured_output),
                         "strict": request.structured_output.strict
                     }
                 }
@@ -212,7 +229,7 @@ class OpenAIProvider(BaseLLMProvider):
     async def complete(self, request: LLMRequest) -> LLMResponse:
         """Send completion request to OpenAI"""
         payload = self._convert_request(request)
-        response = await self._make_request("/chat/completions", payload)
+        response = await self._post_json(self._chat_completions_url, payload)
         return self._convert_response(response, request)
 
     async def stream_complete(self, request: LLMRequest) -> AsyncIterator[LLMStreamChunk]:
@@ -220,10 +237,10 @@ class OpenAIProvider(BaseLLMProvider):
         request.stream = True
         payload = self._convert_request(request)
 
-        async for chunk_data in self._stream_request("/chat/completions", payload):
+        async for chunk_data in self._post_stream(self._chat_completions_url, payload):
             if "choices" in chunk_data and len(chunk_data["choices"]) > 0:
                 choice = chunk_data["choices"][0]
-                yield LLMStreamChunk(
+                yield LLMStreamChunk.model_construct(
                     id=chunk_data["id"],
                     model=chunk_data["model"],
                     delta=choice.get("delta", {}),
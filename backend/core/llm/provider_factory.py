@@ -3,14 +3,17 @@ LLM Provider Factory and Manager (2025)
 Centralized management for all LLM providers
 Supports: OpenAI, Anthropic, Google Gemini, Grok
 """
-from typing import Dict, Optional, Type, List
+from typing import Any, Callable, Dict, Optional, Type, List, Tuple, TypedDict, Union
 from enum import Enum
+import functools
+import importlib
+import logging
+import sys
+import threading
 
 from .base import BaseLLMProvider
-from .openai_provider import OpenAIProvider
-from .anthropic_provider import AnthropicProvider
-from .grok_provider import GrokProvider
-from .gemini_provider import GeminiProvider
+
+logger = logging.getLogger(__name__)
 
 
 class ProviderType(str, Enum):
@@ -21,20 +24,81 @@ class ProviderType(str, Enum):
     GEMINI = "gemini"
 
 
+class ProviderInfo(TypedDict):
+    """Static description of a provider type (get_provider_info)"""
+    name: str
+    supports_tools: bool
+    supports_structured_output: bool
+    supported_models: Tuple[str, ...]
+
+
+class ProviderListEntry(TypedDict):
+    """One registered provider instance (list_providers)"""
+    name: str
+    provider_type: str
+    is_default: bool
+    supports_tools: bool
+    supports_structured_output: bool
+
+
+# Provider type values in declaration order (the enum never changes at runtime)
+_SUPPORTED_PROVIDERS: Tuple[str, ...] = tuple(p.value for p in ProviderType)
+
+
+@functools.lru_cache(maxsize=None)
+def _provider_info(
+    provider_class: Type[BaseLLMProvider],
+    provider_type: Union[ProviderType, str]
+) -> ProviderInfo:
+    """
+    Static capabilities of a provider class, read off its class attributes
+
+    The single capability source for get_provider_info() and every manager;
+    the cached dict is shared, so callers must not mutate it.
+    """
+    return {
+        "name": ProviderType(provider_type).value,
+        "supports_tools": provider_class.SUPPORTS_TOOL_CALLING,
+        "supports_structured_output": provider_class.SUPPORTS_STRUCTURED_OUTPUT,
+        "supported_models": provider_class.SUPPORTED_MODELS_ORDERED
+    }
+
+
 class LLMProviderFactory:
     """Factory for creating LLM provider instances (2025)"""
 
-    _providers: Dict[ProviderType, Type[BaseLLMProvider]] = {
-        ProviderType.OPENAI: OpenAIProvider,
-        ProviderType.ANTHROPIC: AnthropicProvider,
-        ProviderType.GROK: GrokProvider,
-        ProviderType.GEMINI: GeminiProvider,
+    # Keyed by type string; ProviderType members hash and compare equal to
+    # their values, so enum members and raw strings both resolve.
+    # Provider modules are imported on first use of their type.
+    _provider_specs: Dict[str, Tuple[str, str]] = {
+        ProviderType.OPENAI.value: (".openai_provider", "OpenAIProvider"),
+        ProviderType.ANTHROPIC.value: (".anthropic_provider", "AnthropicProvider"),
+        ProviderType.GROK.value: (".grok_provider", "GrokProvider"),
+        ProviderType.GEMINI.value: (".gemini_provider", "GeminiProvider"),
     }
+    # Classes resolved so far
+    _providers: Dict[str, Type[BaseLLMProvider]] = {}
+
+    @classmethod
+    def get_provider_class(
+        cls,
+        provider_type: Union[ProviderType, str]
+    ) -> Optional[Type[BaseLLMProvider]]:
+        """Resolve a provider type to its class, or None if unsupported"""
+        provider_class = cls._providers.get(provider_type)
+        if provider_class is None:
+            spec = cls._provider_specs.get(provider_type)
+            if spec is None:
+                return None
+            module_name, class_name = spec
+            provider_class = getattr(importlib.import_module(module_name, __package__), class_name)
+            cls._providers[ProviderType(provider_type).value] = provider_class
+        return provider_class
 
     @classmethod
     def create(
         cls,
-        provider_type: ProviderType,
+        provider_type: Union[ProviderType, str],
         api_key: str,
         base_url: Optional[str] = None,
         timeout: int = 120
@@ -43,7 +107,7 @@ class LLMProviderFactory:
         Create a new LLM provider instance
 
         Args:
-            provider_type: Type of provider to create
+            provider_type: Type of provider to create (enum member or its value)
             api_key: API key for the provider
             base_url: Optional custom base URL
             timeout: Request timeout in seconds
@@ -54,40 +118,26 @@ class LLMProviderFactory:
         Raises:
             ValueError: If provider type is not supported
         """
-        if provider_type not in cls._providers:
+        provider_class = cls.get_provider_class(provider_type)
+        if provider_class is None:
             raise ValueError(f"Unsupported provider type: {provider_type}")
 
-        provider_class = cls._providers[provider_type]
         return provider_class(api_key=api_key, base_url=base_url, timeout=timeout)
 
     @classmethod
     def get_supported_providers(cls) -> List[str]:
         """Get list of supported provider types"""
-        return [p.value for p in ProviderType]
+        return list(_SUPPORTED_PROVIDERS)
 
     @classmethod
-    def get_provider_info(cls, provider_type: ProviderType) -> Dict[str, any]:
+    def get_provider_info(cls, provider_type: Union[ProviderType, str]) -> ProviderInfo:
         """Get information about a provider"""
-        if provider_type not in cls._providers:
+        provider_class = cls.get_provider_class(provider_type)
+        if provider_class is None:
             raise ValueError(f"Unsupported provider type: {provider_type}")
 
-        provider_class = cls._providers[provider_type]
-        # Create a temporary instance to get capabilities (without API key)
-        try:
-            temp_instance = provider_class(api_key="dummy")
-            return {
-                "name": temp_instance.provider_name,
-                "supports_tools": temp_instance.supports_tool_calling(),
-                "supports_structured_output": temp_instance.supports_structured_output(),
-                "supported_models": temp_instance.get_supported_models()
-            }
-        except:
-            return {
-                "name": provider_type.value,
-                "supports_tools": False,
-                "supports_structured_output": False,
-                "supported_models": []
-            }
+        # Capabilities are static per class; callers get their own copy
+        return ProviderInfo(**_provider_info(provider_class, provider_type))
 
 
 class LLMProviderManager:
@@ -98,12 +148,19 @@ class LLMProviderManager:
 
     def __init__(self):
         self._providers: Dict[str, BaseLLMProvider] = {}
+        # Providers registered lazily: built on first get_provider() call
+        self._pending: Dict[str, Callable[[], BaseLLMProvider]] = {}
+        # name -> shared ProviderInfo for every added or registered provider,
+        # in registration order; also the single membership index across
+        # _providers and _pending
+        self._provider_caps: Dict[str, ProviderInfo] = {}
+        # Names are interned on the way in, so the default is matched by identity
         self._default_provider: Optional[str] = None
 
     def add_provider(
         self,
         name: str,
-        provider_type: ProviderType,
+        provider_type: Union[ProviderType, str],
         api_key: str,
         base_url: Optional[str] = None,
         timeout: int = 120,
@@ -123,7 +180,8 @@ class LLMProviderManager:
         Returns:
             Created provider instance
         """
-        if name in self._providers:
+        name = sys.intern(name)
+        if name in self._provider_caps:
             raise ValueError(f"Provider with name '{name}' already exists")
 
         provider = LLMProviderFactory.create(
@@ -134,12 +192,100 @@ class LLMProviderManager:
         )
 
         self._providers[name] = provider
+        self._provider_caps[name] = _provider_info(type(provider), provider_type)
 
         if set_as_default or not self._default_provider:
             self._default_provider = name
 
         return provider
 
+    def add_providers_bulk(
+        self,
+        specs: List[Tuple[str, Union[ProviderType, str], str, Optional[str], int, bool]]
+    ) -> List[BaseLLMProvider]:
+        """
+        Add several provider instances in one pass
+
+        All names are checked before anything is built, and the manager is
+        only updated once every provider was created, so a bad spec leaves
+        it unchanged.
+
+        Args:
+            specs: (name, provider_type, api_key, base_url, timeout, set_as_default)
+                tuples, in registration order
+
+        Returns:
+            Created provider instances, in spec order
+        """
+        names = [sys.intern(spec[0]) for spec in specs]
+        if len(set(names)) != len(names):
+            raise ValueError("Duplicate provider names in bulk add")
+        for name in names:
+            if name in self._provider_caps:
+                raise ValueError(f"Provider with name '{name}' already exists")
+
+        providers = [
+            LLMProviderFactory.create(
+                provider_type=provider_type,
+                api_key=api_key,
+                base_url=base_url,
+                timeout=timeout
+            )
+            for _, provider_type, api_key, base_url, timeout, _ in specs
+        ]
+
+        for name, (_, provider_type, *_, set_as_default), provider in zip(names, specs, providers):
+            self._providers[name] = provider
+            self._provider_caps[name] = _provider_info(type(provider), provider_type)
+            if set_as_default or not self._default_provider:
+                self._default_provider = name
+
+        return providers
+
+    def register_provider(
+        self,
+        name: str,
+        provider_type: Union[ProviderType, str],
+        api_key: str,
+        base_url: Optional[str] = None,
+        timeout: int = 120,
+        set_as_default: bool = False
+    ):
+        """
+        Register a provider without constructing it
+
+        The instance is created on the first get_provider() call for this
+        name, so configured-but-unused providers cost nothing.
+
+        Args:
+            name: Unique name for this provider instance
+            provider_type: Type of provider
+            api_key: API key
+            base_url: Optional custom base URL
+            timeout: Request timeout
+            set_as_default: Set as default provider
+        """
+        name = sys.intern(name)
+        if name in self._provider_caps:
+            raise ValueError(f"Provider with name '{name}' already exists")
+
+        provider_class = LLMProviderFactory.get_provider_class(provider_type)
+        if provider_class is None:
+            raise ValueError(f"Unsupported provider type: {provider_type}")
+
+        self._pending[name] = functools.partial(
+            LLMProviderFactory.create,
+            provider_type=provider_type,
+            api_key=api_key,
+            base_url=base_url,
+            timeout=timeout
+        )
+        # Capabilities are static per class, so listing never builds the instance
+        self._provider_caps[name] = _provider_info(provider_class, provider_type)
+
+        if set_as_default or not self._default_provider:
+            self._default_provider = name
+
     def get_provider(self, name: Optional[str] = None) -> BaseLLMProvider:
         """
         Get a provider by name, or default provider if name is None
@@ -158,35 +304,45 @@ class LLMProviderManager:
                 raise ValueError("No default provider set")
             name = self._default_provider
 
-        if name not in self._providers:
-            raise ValueError(f"Provider '{name}' not found")
+        provider = self._providers.get(name)
+        if provider is None:
+            factory = self._pending.get(name)
+            if factory is None:
+                raise ValueError(f"Provider '{name}' not found")
+            # Only retire the factory once it succeeds, so a failing
+            # constructor can be retried on the next lookup
+            provider = self._providers[name] = factory()
+            del self._pending[name]
 
-        return self._providers[name]
+        return provider
 
     def remove_provider(self, name: str):
         """Remove a provider"""
-        if name in self._providers:
-            del self._providers[name]
+        if self._provider_caps.pop(name, None) is not None:
+            self._providers.pop(name, None)
+            self._pending.pop(name, None)
             if self._default_provider == name:
                 self._default_provider = None
 
     def set_default_provider(self, name: str):
         """Set default provider"""
-        if name not in self._providers:
+        name = sys.intern(name)
+        if name not in self._provider_caps:
             raise ValueError(f"Provider '{name}' not found")
         self._default_provider = name
 
-    def list_providers(self) -> List[Dict[str, any]]:
+    def list_providers(self) -> List[ProviderListEntry]:
         """List all registered providers"""
+        default = self._default_provider
         return [
             {
                 "name": name,
-                "provider_type": provider.provider_name,
-                "is_default": name == self._default_provider,
-                "supports_tools": provider.supports_tool_calling(),
-                "supports_structured_output": provider.supports_structured_output(),
+                "provider_type": info["name"],
+                "is_default": name is default,
+                "supports_tools": info["supports_tools"],
+                "supports_structured_output": info["supports_structured_output"],
             }
-            for name, provider in self._providers.items()
+            for name, info in self._provider_caps.items()
         ]
 
     def get_default_provider_name(self) -> Optional[str]:
@@ -196,17 +352,65 @@ class LLMProviderManager:
 
 # Global provider manager instance
 _global_manager: Optional[LLMProviderManager] = None
+_global_manager_lock = threading.Lock()
 
 
 def get_global_manager() -> LLMProviderManager:
     """Get or create global provider manager"""
     global _global_manager
-    if _global_manager is None:
-        _global_manager = LLMProviderManager()
-    return _global_manager
-
-
-def initialize_providers_from_config(config: Dict[str, any]):
+    manager = _global_manager
+    if manager is None:
+        # Double-checked so concurrent first callers share one manager
+        with _global_manager_lock:
+            manager = _global_manager
+            if manager is None:
+                manager = _global_manager = LLMProviderManager()
+    return manager
+
+
+def _register_from_config(
+    manager: LLMProviderManager,
+    config: Dict[str, Any],
+    *,
+    config_key: str,
+    name: str,
+    provider_type: ProviderType
+):
+    """Register one provider if its API key is configured"""
+    api_key = config.get(config_key)
+    if not api_key:
+        return
+    try:
+        # OpenAI takes the default when configured; otherwise the first
+        # registered provider becomes the default
+        manager.register_provider(
+            name=name,
+            provider_type=provider_type,
+            api_key=api_key,
+            set_as_default=provider_type is ProviderType.OPENAI
+        )
+    except Exception as e:
+        logger.error("Failed to initialize %s provider: %s", name, e)
+
+
+# One bound step per provider, in registration order
+_CONFIG_INIT_STEPS = tuple(
+    functools.partial(
+        _register_from_config,
+        config_key=config_key,
+        name=name,
+        provider_type=provider_type
+    )
+    for config_key, name, provider_type in (
+        ("OPENAI_API_KEY", "openai", ProviderType.OPENAI),
+        ("ANTHROPIC_API_KEY", "anthropic", ProviderType.ANTHROPIC),
+        ("GROK_API_KEY", "grok", ProviderType.GROK),
+        ("GEMINI_API_KEY", "gemini", ProviderType.GEMINI),
+    )
+)
+
+
+def initialize_providers_from_config(config: Dict[str, Any]):
     """
     Initialize providers from configuration
 
@@ -215,50 +419,5 @@ def initialize_providers_from_config(config: Dict[str, any]):
     """
     manager = get_global_manager()
 
-    # Add OpenAI if configured
-    if config.get("OPENAI_API_KEY"):
-        try:
-            manager.add_provider(
-                name="openai",
-                provider_type=ProviderType.OPENAI,
-                api_key=config["OPENAI_API_KEY"],
-                set_as_default=True
-            )
-        except Exception as e:
-            print(f"Failed to initialize OpenAI provider: {e}")
-
-    # Add Anthropic if configured
-    if config.get("ANTHROPIC_API_KEY"):
-        try:
-            manager.add_provider(
-                name="anthropic",
-                provider_type=ProviderType.ANTHROPIC,
-                api_key=config["ANTHROPIC_API_KEY"],
-                set_as_default=not manager.get_default_provider_name()
-            )
-        except Exception as e:
-            print(f"Failed to initialize Anthropic provider: {e}")
-
-    # Add Grok if configured
-    if config.get("GROK_API_KEY"):
-        try:
-            manager.add_provider(
-                name="grok",
-                provider_type=ProviderType.GROK,
-                api_key=config["GROK_API_KEY"],
-                set_as_default=not manager.get_default_provider_name()
-            )
-        except Exception as e:
-            print(f"Failed to initialize Grok provider: {e}")
-
-    # Add Gemini if configured
-    if config.get("GEMINI_API_KEY"):
-        try:
-            manager.add_provider(
-                name="gemini",
-                provider_type=ProviderType.GEMINI,
-                api_key=config["GEMINI_API_KEY"],
-                set_as_default=not manager.get_default_provider_name()
-            )
-        except Exception as e:
-            print(f"Failed to initialize Gemini provider: {e}")
+    for step in _CONFIG_INIT_STEPS:
+        step(manager, config)
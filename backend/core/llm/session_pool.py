@@ -0,0 +1,64 @@
+"""
+Shared HTTP session pool for LLM providers
+Keeps TCP/TLS connections alive across provider instances and requests
+"""
+from typing import Dict, Optional
+import asyncio
+
+import aiohttp
+
+import json_codec
+
+
+class ProviderSessionPool:
+    """
+    Process-wide aiohttp session shared by all providers
+
+    aiohttp sessions are bound to the event loop they were created on,
+    so one session is kept per running loop. Callers must
+    await ProviderSessionPool.close() before their loop ends; a session left
+    open is only pruned after the loop closes, and its connections leak
+    until garbage collection.
+    """
+
+    CONNECTION_LIMIT = 100
+    DNS_CACHE_TTL = 300  # seconds
+    KEEPALIVE_TIMEOUT = 60  # seconds
+
+    # Running loop -> its session. A session references its loop, so a weak
+    # key would never die; entries for closed loops are pruned explicitly.
+    _sessions: Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+
+    @classmethod
+    def _prune_closed_loops(cls):
+        """Drop sessions whose loop has closed without ProviderSessionPool.close()"""
+        for loop in [loop for loop in cls._sessions if loop.is_closed()]:
+            # A closed loop cannot run session.close(). Detaching only marks
+            # the session closed; its pooled connections stay open until GC
+            cls._sessions.pop(loop).detach()
+
+    @classmethod
+    def get_session(cls) -> aiohttp.ClientSession:
+        """Get the shared session for the running loop, creating it on first use"""
+        cls._prune_closed_loops()
+        loop = asyncio.get_running_loop()
+        session: Optional[aiohttp.ClientSession] = cls._sessions.get(loop)
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=cls.CONNECTION_LIMIT,
+                    ttl_dns_cache=cls.DNS_CACHE_TTL,
+                    keepalive_timeout=cls.KEEPALIVE_TIMEOUT
+                ),
+                json_serialize=json_codec.dumps
+            )
+            cls._sessions[loop] = session
+        return session
+
+    @classmethod
+    async def close(cls):
+        """Close the shared session of the running loop (call on shutdown)"""
+        cls._prune_closed_loops()
+        session = cls._sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None and not session.closed:
+            await session.close()
@@ -8,6 +8,7 @@ from typing import Dict, Any
 from core.llm import (
     get_global_manager,
     initialize_providers_from_config,
+    ProviderSessionPool,
     ProviderType
 )
 from models import (
@@ -17,7 +18,7 @@ from models import (
     ToolDefinition,
     StructuredOutputSchema
 )
-from config import settings
+from config import get_settings
 
 
 async def example_basic_completion():
@@ -25,6 +26,7 @@ async def example_basic_completion():
     print("\n=== Example 1: Basic Completion ===")
 
     # Initialize providers from config
+    settings = get_settings()
     initialize_providers_from_config({
         "OPENAI_API_KEY": settings.OPENAI_API_KEY,
         "ANTHROPIC_API_KEY": settings.ANTHROPIC_API_KEY,
@@ -328,6 +330,9 @@ async def main():
     except Exception as e:
         print(f"Error: {e}")
 
+    # Release the shared HTTP session before the event loop closes
+    await ProviderSessionPool.close()
+
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -0,0 +1,41 @@
+"""
+Shared JSON codec for the data models and LLM providers
+Backed by orjson, with a standard-library fallback
+"""
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is in requirements.txt
+    orjson = None
+
+
+if orjson is not None:
+    # Non-str keys are accepted to match json.dumps on tool arguments
+    _DUMPS_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+    JSONDecodeError = orjson.JSONDecodeError
+    loads = orjson.loads
+    # Wraps already-encoded JSON so dumps() embeds it verbatim (orjson >= 3.9)
+    Fragment = getattr(orjson, "Fragment", None)
+
+    def dumps_bytes(obj) -> bytes:
+        """Serialize to compact UTF-8 JSON bytes"""
+        return orjson.dumps(obj, option=_DUMPS_OPTIONS)
+
+    def dumps(obj) -> str:
+        """Serialize to compact JSON text"""
+        return orjson.dumps(obj, option=_DUMPS_OPTIONS).decode()
+
+else:
+    JSONDecodeError = json.JSONDecodeError
+    loads = json.loads  # accepts str and bytes
+    Fragment = None
+
+    def dumps(obj) -> str:
+        """Serialize to compact JSON text"""
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+    def dumps_bytes(obj) -> bytes:
+        """Serialize to compact UTF-8 JSON bytes"""
+        return dumps(obj).encode()
@@ -6,7 +6,10 @@ from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 import uvicorn
 
-from config import settings
+from config import get_settings
+from core.llm import ProviderSessionPool
+
+settings = get_settings()
 
 
 @asynccontextmanager
@@ -17,6 +20,7 @@ async def lifespan(app: FastAPI):
     yield
     # Shutdown
     print("Shutting down...")
+    await ProviderSessionPool.close()
 
 
 # Create FastAPI app
@@ -1,10 +1,12 @@
 """
 Data models for LLM integration
 """
-from typing import Optional, List, Dict, Any, Literal, Union
-from pydantic import BaseModel, Field
+from typing import Optional, List, Dict, Any, Literal, Union, Tuple
+from pydantic import BaseModel, Field, PrivateAttr
 from enum import Enum
 
+import json_codec
+
 
 class MessageRole(str, Enum):
     """Message role types"""
@@ -47,12 +49,40 @@ class ToolCall(BaseModel):
     name: str
     arguments: Union[str, Dict[str, Any]]  # String (JSON) or parsed dict
 
-    def get_arguments_dict(self) -> Dict[str, Any]:
-        """Get arguments as dictionary"""
+    # (arguments object, its JSON text); reused while arguments is the same object
+    _arguments_json: Optional[Tuple[Dict[str, Any], str]] = PrivateAttr(default=None)
+    # (arguments string, its parsed dict); reused while arguments is the same string
+    _arguments_dict: Optional[Tuple[str, Dict[str, Any]]] = PrivateAttr(default=None)
+
+    def get_arguments_json(self) -> str:
+        """
+        Get arguments as a JSON string
+
+        Dict arguments are serialized once and reused for as long as the
+        same dict stays assigned; mutating it in place is not detected.
+        """
         if isinstance(self.arguments, str):
-            import json
-            return json.loads(self.arguments)
-        return self.arguments
+            return self.arguments
+        cached = self._arguments_json
+        if cached is None or cached[0] is not self.arguments:
+            cached = (self.arguments, json_codec.dumps(self.arguments))
+            self._arguments_json = cached
+        return cached[1]
+
+    def get_arguments_dict(self) -> Dict[str, Any]:
+        """
+        Get arguments as dictionary
+
+        JSON string arguments are parsed once for as long as the same string
+        stays assigned; each call returns a shallow copy of the parsed dict.
+        """
+        if not isinstance(self.arguments, str):
+            return self.arguments
+        cached = self._arguments_dict
+        if cached is None or cached[0] is not self.arguments:
+            cached = (self.arguments, json_codec.loads(self.arguments))
+            self._arguments_dict = cached
+        return dict(cached[1])
 
 
 class ToolResult(BaseModel):
@@ -79,6 +109,22 @@ class StructuredOutputSchema(BaseModel):
     schema: Dict[str, Any]
     strict: bool = True  # Enforce strict schema adherence
 
+    # (schema object, its JSON text); reused while schema is the same object
+    _schema_json: Optional[Tuple[Dict[str, Any], str]] = PrivateAttr(default=None)
+
+    def get_schema_json(self) -> str:
+        """
+        Get the schema as a JSON string
+
+        Serialized once and reused for as long as the same schema dict
+        stays assigned; mutating it in place is not detected.
+        """
+        cached = self._schema_json
+        if cached is None or cached[0] is not self.schema:
+            cached = (self.schema, json_codec.dumps(self.schema))
+            self._schema_json = cached
+        return cached[1]
+
 
 class LLMRequest(BaseModel):
     """Unified LLM request"""
@@ -112,7 +158,12 @@ class LLMResponse(BaseModel):
 
 
 class LLMStreamChunk(BaseModel):
-    """Stream chunk for streaming responses"""
+    """
+    Stream chunk for streaming responses
+
+    Providers emit one per token via model_construct(), skipping pydantic
+    validation, so they must pass fields already of the declared types.
+    """
     id: str
     model: str
     delta: Dict[str, Any]  # Incremental changes